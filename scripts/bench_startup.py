@@ -0,0 +1,175 @@
+"""Startup benchmark for the figma-mcp entry point.
+
+Measures, over several fresh interpreter runs:
+  - mcp_setup: in-process time to import fastmcp and build the MCP server,
+    i.e. the work `run_async` does before it can read stdio
+  - initialize: spawn -> response to the MCP `initialize` request
+  - first_tool: spawn -> response to the first `tools/call` (list_jobs)
+  - first_enqueue: spawn -> response to the first `enqueue_ops` call, which
+    is the first call to need the lazily loaded ops models
+
+Usage:
+    python scripts/bench_startup.py [--runs N] [--json]
+"""
+import argparse
+import json
+import os
+import queue
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RESPONSE_TIMEOUT = 30.0
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _env() -> dict[str, str]:
+    env = dict(os.environ)
+    env["FIGMA_MCP_PORT"] = str(_free_port())
+    env.setdefault("FIGMA_MCP_TOKEN", "bench")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    return env
+
+
+def measure_mcp_setup() -> float:
+    code = (
+        "import time; t = time.perf_counter(); "
+        "from server.main import create_mcp; from server.job_queue import JobQueue; "
+        "create_mcp(JobQueue()); "
+        "print(time.perf_counter() - t)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT, env=_env(), capture_output=True, text=True, check=True,
+    )
+    return float(out.stdout.strip())
+
+
+def _send(proc: subprocess.Popen, msg: dict) -> None:
+    proc.stdin.write(json.dumps(msg) + "\n")
+    proc.stdin.flush()
+
+
+def _read_lines(proc: subprocess.Popen, lines: queue.Queue) -> None:
+    for line in proc.stdout:
+        lines.put(line)
+    lines.put(None)
+
+
+def _wait_for(lines: queue.Queue, msg_id: int) -> dict:
+    deadline = time.monotonic() + RESPONSE_TIMEOUT
+    while True:
+        remaining = deadline - time.monotonic()
+        try:
+            line = lines.get(timeout=max(remaining, 0))
+        except queue.Empty:
+            raise TimeoutError(f"no response to request {msg_id} within {RESPONSE_TIMEOUT}s") from None
+        if line is None:
+            raise RuntimeError(f"server exited before responding to request {msg_id}")
+        try:
+            msg = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if msg.get("id") == msg_id:
+            return msg
+
+
+def measure_handshake() -> tuple[float, float, float]:
+    """Return seconds from spawn to the initialize, list_jobs and enqueue_ops responses."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "server.main"],
+        cwd=REPO_ROOT, env=_env(), text=True,
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+    )
+    lines: queue.Queue = queue.Queue()
+    threading.Thread(target=_read_lines, args=(proc, lines), daemon=True).start()
+    try:
+        _send(proc, {
+            "jsonrpc": "2.0", "id": 1, "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {},
+                "clientInfo": {"name": "bench_startup", "version": "0"},
+            },
+        })
+        _wait_for(lines, 1)
+        initialized = time.perf_counter() - start
+
+        _send(proc, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+        _send(proc, {
+            "jsonrpc": "2.0", "id": 2, "method": "tools/call",
+            "params": {"name": "list_jobs", "arguments": {}},
+        })
+        _wait_for(lines, 2)
+        first_tool = time.perf_counter() - start
+
+        _send(proc, {
+            "jsonrpc": "2.0", "id": 3, "method": "tools/call",
+            "params": {
+                "name": "enqueue_ops",
+                "arguments": {"ops": [{"op": "CREATE_RECTANGLE", "tempId": "r"}]},
+            },
+        })
+        reply = _wait_for(lines, 3)
+        if "Job created" not in json.dumps(reply):
+            raise RuntimeError(f"enqueue_ops failed: {reply}")
+        first_enqueue = time.perf_counter() - start
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+    return initialized, first_tool, first_enqueue
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    return {
+        "median_ms": round(statistics.median(samples) * 1000, 1),
+        "min_ms": round(min(samples) * 1000, 1),
+        "max_ms": round(max(samples) * 1000, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    metrics = ("mcp_setup", "initialize", "first_tool", "first_enqueue")
+    samples: dict[str, list[float]] = {name: [] for name in metrics}
+    for _ in range(args.runs):
+        samples["mcp_setup"].append(measure_mcp_setup())
+        init, tool, enqueue = measure_handshake()
+        samples["initialize"].append(init)
+        samples["first_tool"].append(tool)
+        samples["first_enqueue"].append(enqueue)
+
+    results = {
+        "runs": args.runs,
+        "python": sys.version.split()[0],
+        **{name: _summary(samples[name]) for name in metrics},
+    }
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for name in metrics:
+        r = results[name]
+        print(f"{name:<14} median {r['median_ms']:>8.1f} ms  "
+              f"(min {r['min_ms']:.1f}, max {r['max_ms']:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,31 @@
 import asyncio
 import os
 import sys
+from typing import TYPE_CHECKING, Callable
 
-import uvicorn
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastmcp import FastMCP
-
-from .auth import init_auth_token
-from .http_routes import init_routes
 from .job_queue import JobQueue
-from .mcp_tools import register_tools
+
+# fastmcp, FastAPI, uvicorn and the ops models are imported inside the
+# functions that need them so the stdio handshake isn't held up by imports
+# only the HTTP bridge uses.
+if TYPE_CHECKING:
+    import uvicorn
+    from fastapi import FastAPI
+    from fastmcp import FastMCP
 
 HTTP_PORT = int(os.environ.get("FIGMA_MCP_PORT", "8400"))
 
+# Upper bound on how long the HTTP bridge waits for the MCP handshake before
+# building anyway (e.g. a client that never sends notifications/initialized).
+HTTP_START_TIMEOUT = 5.0
 
-def create_app() -> tuple[FastMCP, FastAPI]:
-    queue = JobQueue()
 
-    # MCP server (stdio)
+def create_mcp(queue: JobQueue, on_initialized: Callable[[], None] | None = None) -> "FastMCP":
+    from fastmcp import FastMCP
+    from mcp.types import InitializedNotification
+
+    from .mcp_tools import register_tools
+
     mcp = FastMCP("figma-mcp", instructions=(
         "You are a Figma design assistant. Use enqueue_ops to create designs in Figma. "
         "Each op needs a unique tempId. Use parentTempId to nest elements. "
@@ -27,7 +34,22 @@ def create_app() -> tuple[FastMCP, FastAPI]:
     ))
     register_tools(mcp, queue)
 
-    # FastAPI app (HTTP for plugin polling)
+    if on_initialized is not None:
+        async def _initialized(_notification: InitializedNotification) -> None:
+            on_initialized()
+
+        # fastmcp (<2.3) has no public hook for this; register on the
+        # low-level server it wraps.
+        mcp._mcp_server.notification_handlers[InitializedNotification] = _initialized
+    return mcp
+
+
+def create_api(queue: JobQueue) -> "FastAPI":
+    from fastapi import FastAPI
+    from fastapi.middleware.cors import CORSMiddleware
+
+    from .http_routes import init_routes
+
     api = FastAPI(title="figma-mcp-bridge")
     api.add_middleware(
         CORSMiddleware,
@@ -43,12 +65,18 @@ def create_app() -> tuple[FastMCP, FastAPI]:
     async def health():
         return {"status": "ok"}
 
-    return mcp, api
+    return api
 
 
-async def run_async():
-    mcp, api = create_app()
+def _build_http_server(queue: JobQueue) -> "uvicorn.Server":
+    """Build the plugin-facing HTTP server. Runs off the event loop."""
+    # Warm the ops models first so the first enqueue_ops call doesn't pay for them.
+    from . import ops_schema  # noqa: F401
+    import uvicorn
+
+    from .auth import init_auth_token
 
+    api = create_api(queue)
     init_auth_token()
 
     config = uvicorn.Config(
@@ -57,14 +85,34 @@ async def run_async():
         port=HTTP_PORT,
         log_level="warning",
     )
-    http_server = uvicorn.Server(config)
+    return uvicorn.Server(config)
+
 
+async def serve_http(queue: JobQueue, mcp_ready: asyncio.Event) -> None:
+    # Hold off the FastAPI/ops_schema imports until the MCP handshake is done
+    # so they don't compete with it for the GIL.
+    try:
+        await asyncio.wait_for(mcp_ready.wait(), timeout=HTTP_START_TIMEOUT)
+    except asyncio.TimeoutError:
+        pass
+
+    http_server = await asyncio.to_thread(_build_http_server, queue)
     print(f"HTTP bridge listening on http://127.0.0.1:{HTTP_PORT}", file=sys.stderr)
+    await http_server.serve()
+
+
+async def run_async():
+    queue = JobQueue()
+    mcp_ready = asyncio.Event()
+
+    # MCP server (stdio) comes up first; the HTTP bridge for plugin polling
+    # is built in a worker thread once the client handshake has completed.
+    mcp = create_mcp(queue, on_initialized=mcp_ready.set)
     print("MCP server ready on stdio", file=sys.stderr)
 
     await asyncio.gather(
         mcp.run_async(transport="stdio"),
-        http_server.serve(),
+        serve_http(queue, mcp_ready),
     )
 
 
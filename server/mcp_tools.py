@@ -1,9 +1,6 @@
 import asyncio
 
-from pydantic import ValidationError
-
 from .job_queue import JobQueue
-from .ops_schema import serialize_ops, validate_ops
 
 
 def register_tools(mcp, queue: JobQueue) -> None:
@@ -44,6 +41,11 @@ def register_tools(mcp, queue: JobQueue) -> None:
 
         Returns the job ID. Use get_job_status to wait for the result.
         """
+        # Deferred so building the op models stays off the startup path.
+        from pydantic import ValidationError
+
+        from .ops_schema import serialize_ops, validate_ops
+
         try:
             batch = validate_ops(ops)
         except (ValidationError, ValueError) as e: